@@ -13,515 +13,763 @@ Requirements:
 Usage:
     python scripts/generate_architecture_diagram.py
 
+    Set DIAGRAM_FMT to change the output formats (comma-separated),
+    e.g. DIAGRAM_FMT=svg to skip PNG rasterization.
+
 Output:
-    Creates PNG files in the docs/architecture/ directory:
+    Creates PNG + SVG files in the docs/architecture/ directory:
     - architecture-main.png          (Main system overview)
     - architecture-clean.png         (Clean Architecture layers)
     - architecture-sse-flow.png      (SSE event streaming)
     - architecture-dual-database.png (SQL Server + PostgreSQL)
     - architecture-observability.png (OpenTelemetry + Aspire)
     - architecture-content-safety.png (Azure OpenAI filtering)
+
+    PNG is kept for GitHub previews; SVG skips the raster stage and
+    stays crisp at any zoom in the docs.
 """
 
-from diagrams import Diagram, Cluster, Edge
-from diagrams.azure.database import SQLDatabases, DatabaseForPostgresqlServers
-from diagrams.azure.ml import AzureOpenAI, CognitiveServices
-from diagrams.azure.devops import ApplicationInsights
-from diagrams.azure.monitor import Monitor
-from diagrams.onprem.client import User
-from diagrams.programming.framework import React, NextJs, DotNet
-from diagrams.programming.language import Csharp, Typescript
-from diagrams.generic.compute import Rack
-from diagrams.generic.storage import Storage
+# Node classes (diagrams.azure.*, diagrams.programming.*, ...) are imported
+# lazily inside each builder: every submodule import triggers a package-data
+# scan for icon files, and a given run (or pool worker) only needs the
+# subset its diagrams actually use.
+from diagrams import Diagram, Cluster, Node, getdiagram, setdiagram
+import argparse
+import hashlib
 import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib import import_module
+from pathlib import Path
+from types import MappingProxyType
+from concurrent.futures import ProcessPoolExecutor
+
+# The diagrams library resolves the icon path from package data on every
+# node construction, and the same handful of icons (Csharp, DotNet, ...)
+# is instantiated dozens of times across the diagrams. Memoize the
+# resolution per node class so repeated lookups skip the filesystem walk.
+# _load_icon only reads the _icon_dir/_icon class attributes, so it can be
+# called with the class itself and cached per class.
+_load_icon_uncached = Node._load_icon
+
+
+@lru_cache(maxsize=None)
+def _icon_path(node_cls):
+    return _load_icon_uncached(node_cls)
+
+
+def _load_icon_cached(self):
+    return _icon_path(type(self))
+
+
+Node._load_icon = _load_icon_cached
 
 # Get the directory where this script is located
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 OUTPUT_DIR = os.path.join(SCRIPT_DIR, "..", "docs", "architecture")
 
-# Create output directory if it doesn't exist
-os.makedirs(OUTPUT_DIR, exist_ok=True)
+# Create output directory if it doesn't exist (skip the syscall when warm)
+if not os.path.isdir(OUTPUT_DIR):
+    os.makedirs(OUTPUT_DIR)
+
+# Precomputed output paths (filename without extension), one per diagram,
+# so the builders don't re-join paths on every call
+OUTPUT_PATHS = {
+    name: os.path.join(OUTPUT_DIR, name)
+    for name in (
+        "architecture-main",
+        "architecture-clean",
+        "architecture-sse-flow",
+        "architecture-streaming",
+        "architecture-event-types",
+        "architecture-dual-database",
+        "architecture-observability",
+        "architecture-content-safety",
+        "c4-1-context",
+        "c4-2-container",
+        "c4-3-component-backend",
+    )
+}
 
 # Common graph attributes for better readability
-GRAPH_ATTR = {
+GRAPH_ATTR = MappingProxyType({
     "fontsize": "18",
-    "fontname": "Arial Bold",
+    "fontname": "Helvetica-Bold",
     "bgcolor": "white",
     "pad": "0.4",
-    "splines": "ortho",
-    "nodesep": "0.8",
-    "ranksep": "1.0",
-}
+    # Straight edges - the orthogonal router is the most expensive
+    # post-layout step and these small diagrams don't need it
+    "splines": "line",
+    # Tight spacing shrinks the coordinate space dot's ranking and
+    # routing passes have to search; diagrams that need more room bump
+    # these in their own variants below
+    "nodesep": "0.4",
+    "ranksep": "0.5",
+})
 
 # Node attributes - readable fonts with adequate spacing
-NODE_ATTR = {
+NODE_ATTR = MappingProxyType({
     "fontsize": "12",
-    "fontname": "Arial",
+    "fontname": "Helvetica",
     "fontcolor": "#333333",
     "margin": "0.2",  # Add margin to prevent label clipping
     "height": "1.2",  # Minimum height for nodes
-}
+})
 
 # Edge attributes
-EDGE_ATTR = {
+EDGE_ATTR = MappingProxyType({
     "fontsize": "11",
-    "fontname": "Arial",
+    "fontname": "Helvetica",
     "fontcolor": "#555555",
     "penwidth": "1.5",
-}
+})
 
 # Cluster attributes - Different colors for different layers
-CLUSTER_FRONTEND = {
+CLUSTER_FRONTEND = MappingProxyType({
     "fontsize": "13",
-    "fontname": "Arial Bold",
+    "fontname": "Helvetica-Bold",
     "fontcolor": "#1a1a1a",
     "style": "rounded",
     "bgcolor": "#e3f2fd",  # Light blue
     "penwidth": "2",
     "margin": "16",
-}
+})
 
-CLUSTER_BACKEND = {
+CLUSTER_BACKEND = MappingProxyType({
     "fontsize": "13",
-    "fontname": "Arial Bold",
+    "fontname": "Helvetica-Bold",
     "fontcolor": "#1a1a1a",
     "style": "rounded",
     "bgcolor": "#e8f5e9",  # Light green
     "penwidth": "2",
     "margin": "16",
-}
+})
 
-CLUSTER_DATABASE = {
+CLUSTER_DATABASE = MappingProxyType({
     "fontsize": "13",
-    "fontname": "Arial Bold",
+    "fontname": "Helvetica-Bold",
     "fontcolor": "#1a1a1a",
     "style": "rounded",
     "bgcolor": "#fff3e0",  # Light orange
     "penwidth": "2",
     "margin": "16",
-}
+})
 
-CLUSTER_AZURE = {
+CLUSTER_AZURE = MappingProxyType({
     "fontsize": "13",
-    "fontname": "Arial Bold",
+    "fontname": "Helvetica-Bold",
     "fontcolor": "#1a1a1a",
     "style": "rounded",
     "bgcolor": "#e1f5fe",  # Light cyan (Azure)
     "penwidth": "2",
     "margin": "16",
-}
+})
 
-CLUSTER_OBSERVABILITY = {
+# Precomputed color variants so the per-diagram {**CLUSTER_DATABASE, ...}
+# merges aren't rebuilt on every call
+CLUSTER_DATABASE_BLUE = MappingProxyType({**CLUSTER_DATABASE, "bgcolor": "#e3f2fd"})
+CLUSTER_DATABASE_GREEN = MappingProxyType({**CLUSTER_DATABASE, "bgcolor": "#e8f5e9"})
+CLUSTER_AZURE_COMPACT = MappingProxyType({**CLUSTER_AZURE, "margin": "8"})
+
+CLUSTER_OBSERVABILITY = MappingProxyType({
     "fontsize": "13",
-    "fontname": "Arial Bold",
+    "fontname": "Helvetica-Bold",
     "fontcolor": "#1a1a1a",
     "style": "rounded",
     "bgcolor": "#f3e5f5",  # Light purple
     "penwidth": "2",
     "margin": "16",
-}
+})
 
 # Clean Architecture layer colors
-LAYER_PRESENTATION = {
+LAYER_PRESENTATION = MappingProxyType({
     "fontsize": "12",
-    "fontname": "Arial Bold",
+    "fontname": "Helvetica-Bold",
     "fontcolor": "#1a1a1a",
     "style": "rounded",
     "bgcolor": "#bbdefb",  # Blue
     "penwidth": "2",
     "margin": "12",
-}
+})
 
-LAYER_INFRASTRUCTURE = {
+LAYER_INFRASTRUCTURE = MappingProxyType({
     "fontsize": "12",
-    "fontname": "Arial Bold",
+    "fontname": "Helvetica-Bold",
     "fontcolor": "#1a1a1a",
     "style": "rounded",
     "bgcolor": "#c8e6c9",  # Green
     "penwidth": "2",
     "margin": "12",
-}
+})
 
-LAYER_APPLICATION = {
+LAYER_APPLICATION = MappingProxyType({
     "fontsize": "12",
-    "fontname": "Arial Bold",
+    "fontname": "Helvetica-Bold",
     "fontcolor": "#1a1a1a",
     "style": "rounded",
     "bgcolor": "#ffe0b2",  # Orange
     "penwidth": "2",
     "margin": "12",
-}
+})
 
-LAYER_DOMAIN = {
+LAYER_DOMAIN = MappingProxyType({
     "fontsize": "12",
-    "fontname": "Arial Bold",
+    "fontname": "Helvetica-Bold",
     "fontcolor": "#1a1a1a",
     "style": "rounded",
     "bgcolor": "#ffcdd2",  # Red (core)
     "penwidth": "2",
     "margin": "12",
-}
+})
 
+# Per-diagram attribute variants, merged once at import time and frozen
+# like the base dicts above, so builder calls (and forked pool workers on
+# Linux, via copy-on-write pages) share them without re-copying.
+# concentrate=true merges parallel edges before routing on the dense
+# diagrams (many edges fanning into the same services/agent nodes),
+# cutting the number of splines to compute. Not used where parallel
+# edges carry distinct meaning (e.g. the red/green content-safety paths).
+MAIN_GRAPH_ATTR = MappingProxyType({**GRAPH_ATTR, "concentrate": "true"})
+CLEAN_GRAPH_ATTR = MappingProxyType(
+    {**GRAPH_ATTR, "splines": "spline", "ranksep": "0.8", "concentrate": "true"}
+)
+RANKSEP_07_GRAPH_ATTR = MappingProxyType({**GRAPH_ATTR, "ranksep": "0.7"})
+OBSERVABILITY_GRAPH_ATTR = MappingProxyType(
+    {**RANKSEP_07_GRAPH_ATTR, "concentrate": "true"}
+)
+STREAMING_GRAPH_ATTR = MappingProxyType(
+    {**GRAPH_ATTR, "nodesep": "0.6", "ranksep": "0.8", "splines": "polyline"}
+)
 
-def create_main_architecture():
-    """Create the main architecture diagram - System Overview."""
-    
-    with Diagram(
-        "TaskAgent - AI-Powered Task Management",
-        show=False,
-        filename=os.path.join(OUTPUT_DIR, "architecture-main"),
-        outformat="png",
-        graph_attr=GRAPH_ATTR,
-        node_attr=NODE_ATTR,
-        edge_attr=EDGE_ATTR,
-        direction="TB"
-    ):
-        user = User("User")
-        
-        # Frontend Layer
-        with Cluster("Frontend (Next.js 16)", graph_attr=CLUSTER_FRONTEND):
-            nextjs = NextJs("App Router")
-            chat_ui = Typescript("Chat UI")
-            sse_client = Typescript("SSE Client")
-        
-        # Backend Layer
-        with Cluster("Backend (.NET 10)", graph_attr=CLUSTER_BACKEND):
-            webapi = DotNet("Web API")
-            agent = DotNet("Agent Framework")
-            functions = Csharp("Function Tools")
-        
-        # Database Layer
-        with Cluster("Databases", graph_attr=CLUSTER_DATABASE):
-            sqlserver = SQLDatabases("SQL Server")
-            postgres = DatabaseForPostgresqlServers("PostgreSQL")
-        
-        # Azure Services
-        with Cluster("Azure Services", graph_attr=CLUSTER_AZURE):
-            openai = AzureOpenAI("GPT-4o-mini")
-            appinsights = ApplicationInsights("App Insights")
-        
-        # Flow connections
-        user >> nextjs
-        nextjs >> chat_ui >> sse_client
-        sse_client >> Edge(label="SSE Stream", fontsize="11") >> webapi
-        webapi >> agent >> functions
-        functions >> sqlserver
-        agent >> postgres
-        agent >> openai
-        webapi >> appinsights
-
-
-def create_clean_architecture():
-    """Create Clean Architecture layers diagram."""
-    
-    with Diagram(
-        "TaskAgent - Clean Architecture",
-        show=False,
-        filename=os.path.join(OUTPUT_DIR, "architecture-clean"),
-        outformat="png",
-        graph_attr={**GRAPH_ATTR, "ranksep": "0.8"},
-        node_attr=NODE_ATTR,
-        edge_attr=EDGE_ATTR,
-        direction="TB"
-    ):
-        # Presentation Layer (WebApi uses DotNet)
-        with Cluster("Presentation (WebApi)", graph_attr=LAYER_PRESENTATION):
-            controllers = DotNet("Controllers")
-            streaming = DotNet("SSE Service")
-            middleware = DotNet("Middleware")
-        
-        # Infrastructure Layer
-        with Cluster("Infrastructure", graph_attr=LAYER_INFRASTRUCTURE):
-            dbcontext = Csharp("DbContexts")
-            repositories = Csharp("Repositories")
-            services = Csharp("Services")
-        
-        # Application Layer
-        with Cluster("Application", graph_attr=LAYER_APPLICATION):
-            dtos = Csharp("DTOs")
-            interfaces = Csharp("Interfaces")
-            functions = Csharp("Functions (6)")
-            telemetry = Csharp("Telemetry")
-        
-        # Domain Layer
-        with Cluster("Domain", graph_attr=LAYER_DOMAIN):
-            entities = Csharp("Entities")
-            enums = Csharp("Enums")
-            rules = Csharp("Business Rules")
-        
-        # Dependency flow (downward only - Clean Architecture)
-        controllers >> Edge(style="dashed", color="#1976d2") >> services
-        streaming >> Edge(style="dashed", color="#1976d2") >> services
-        
-        dbcontext >> Edge(style="dashed", color="#388e3c") >> interfaces
-        repositories >> Edge(style="dashed", color="#388e3c") >> interfaces
-        services >> Edge(style="dashed", color="#388e3c") >> functions
-        
-        dtos >> Edge(style="dashed", color="#f57c00") >> entities
-        interfaces >> Edge(style="dashed", color="#f57c00") >> entities
-        functions >> Edge(style="dashed", color="#f57c00") >> entities
-
-
-def create_sse_flow_diagram():
-    """Create SSE Event Streaming flow diagram."""
-    
-    sse_graph = {**GRAPH_ATTR, "nodesep": "0.5", "ranksep": "0.6", "splines": "polyline"}
-    
-    with Diagram(
-        "TaskAgent - SSE Event Flow",
-        show=False,
-        filename=os.path.join(OUTPUT_DIR, "architecture-sse-flow"),
-        outformat="png",
-        graph_attr=sse_graph,
-        node_attr=NODE_ATTR,
-        edge_attr=EDGE_ATTR,
-        direction="LR"
-    ):
-        # Frontend
-        with Cluster("Frontend", graph_attr=CLUSTER_FRONTEND):
-            chat_input = NextJs("ChatInput")
-            use_chat = Typescript("useChat")
-            messages = NextJs("Messages")
-        
-        # Backend
-        with Cluster("Backend", graph_attr=CLUSTER_BACKEND):
-            controller = DotNet("Controller")
-            agent_service = DotNet("Streaming")
-            agent = Csharp("Agent")
-        
-        # SSE Connection
-        with Cluster("SSE", graph_attr=CLUSTER_AZURE):
-            sse_events = Rack("Events")
-        
-        # Flow
-        chat_input >> use_chat
-        use_chat >> controller
-        controller >> agent_service >> agent
-        agent >> Edge(style="dashed") >> sse_events
-        sse_events >> Edge(color="#1976d2") >> messages
-
-
-def create_streaming_architecture():
-    """Create detailed Streaming Architecture diagram for article."""
-    
-    streaming_graph = {**GRAPH_ATTR, "nodesep": "0.6", "ranksep": "0.8", "splines": "polyline"}
-    
-    with Diagram(
-        "TaskAgent - Streaming Architecture",
-        show=False,
-        filename=os.path.join(OUTPUT_DIR, "architecture-streaming"),
-        outformat="png",
-        graph_attr=streaming_graph,
-        node_attr=NODE_ATTR,
-        edge_attr=EDGE_ATTR,
-        direction="LR"
-    ):
-        user = User("User")
-        
-        # Frontend Layer
-        with Cluster("Next.js Frontend", graph_attr=CLUSTER_FRONTEND):
-            use_chat = Typescript("useChat Hook")
-            chat_list = NextJs("MessagesList")
-        
-        # Backend Layer
-        with Cluster(".NET Backend", graph_attr=CLUSTER_BACKEND):
-            controller = DotNet("AgentController")
-            sse_service = DotNet("SseStreamingService")
-            agent = Csharp("AIAgent")
-        
-        # Persistence
-        with Cluster("Persistence", graph_attr=CLUSTER_DATABASE):
-            postgres = DatabaseForPostgresqlServers("PostgreSQL")
-            store = Csharp("ChatMessageStore")
-        
-        # Flow with labels
-        user >> use_chat
-        use_chat >> Edge(label="POST /api/agent/chat", fontsize="10") >> controller
-        controller >> sse_service >> agent
-        agent >> store >> postgres
-        
-        # SSE response back
-        sse_service >> Edge(label="SSE Events", style="dashed", color="#1976d2", fontsize="10") >> chat_list
-
-
-def create_event_sequence_diagram():
-    """Create SSE Event Sequence diagram for article - simplified horizontal flow."""
-    
-    event_graph = {
-        "fontsize": "18",
-        "fontname": "Arial Bold",
-        "bgcolor": "white",
-        "nodesep": "0.6",  # Horizontal space between nodes
-        "ranksep": "0.4",  # Minimal vertical space
-        "splines": "spline",  # Curved lines - more compact than ortho
-        "dpi": "150",
-        "pad": "0.1",
-    }
-    
-    # Custom node attr
-    event_node_attr = {
-        **NODE_ATTR,
-        "fontsize": "11",
-        "labelloc": "b",
-    }
-    
-    with Diagram(
-        "TaskAgent - SSE Event Flow",
-        show=False,
-        filename=os.path.join(OUTPUT_DIR, "architecture-event-types"),
-        outformat="png",
-        graph_attr=event_graph,
-        node_attr=event_node_attr,
-        edge_attr=EDGE_ATTR,
-        direction="LR"
-    ):
-        # Client request
-        client = Typescript("\nClient")
-        
-        # SSE Events - compact cluster
-        with Cluster("SSE Stream", graph_attr={**CLUSTER_AZURE, "margin": "8"}):
-            msg_start = Csharp("\nTEXT_START")
-            msg_content = Csharp("\nTEXT_CONTENT")
-            tool_call = Csharp("\nTOOL_CALL")
-            tool_result = Csharp("\nTOOL_RESULT")
-            thread_state = Csharp("\nTHREAD_STATE")
-        
-        done = Rack("\n[DONE]")
-        
-        # Simple linear flow
-        client >> msg_start
-        msg_start >> msg_content
-        msg_content >> tool_call
-        tool_call >> tool_result
-        tool_result >> msg_content
-        msg_content >> thread_state
-        thread_state >> done
-
-
-def create_dual_database_diagram():
-    """Create Dual Database Architecture diagram."""
-    
-    with Diagram(
-        "TaskAgent - Dual Database",
-        show=False,
-        filename=os.path.join(OUTPUT_DIR, "architecture-dual-database"),
-        outformat="png",
-        graph_attr={**GRAPH_ATTR, "ranksep": "0.7"},
-        node_attr=NODE_ATTR,
-        edge_attr=EDGE_ATTR,
-        direction="TB"
-    ):
-        # Application
-        agent = DotNet("Agent Framework")
-        
-        # SQL Server cluster
-        with Cluster("SQL Server (Tasks)", graph_attr={**CLUSTER_DATABASE, "bgcolor": "#e3f2fd"}):
-            task_repo = Csharp("Repository")
-            task_context = Csharp("DbContext")
-            task_table = SQLDatabases("Tasks")
-        
-        # PostgreSQL cluster
-        with Cluster("PostgreSQL (Chats)", graph_attr={**CLUSTER_DATABASE, "bgcolor": "#e8f5e9"}):
-            thread_service = Csharp("Persistence")
-            conv_context = Csharp("DbContext")
-            conv_table = DatabaseForPostgresqlServers("Threads")
-        
-        # Connections
-        agent >> Edge(label="Tasks") >> task_repo
-        task_repo >> task_context >> task_table
-        
-        agent >> Edge(label="Chats") >> thread_service
-        thread_service >> conv_context >> conv_table
-
-
-def create_observability_diagram():
-    """Create Observability Stack diagram."""
-    
-    with Diagram(
-        "TaskAgent - Observability",
-        show=False,
-        filename=os.path.join(OUTPUT_DIR, "architecture-observability"),
-        outformat="png",
-        graph_attr={**GRAPH_ATTR, "ranksep": "0.7"},
-        node_attr=NODE_ATTR,
-        edge_attr=EDGE_ATTR,
-        direction="TB"
-    ):
-        # Application
-        webapi = DotNet("WebApi")
-        
-        # Telemetry sources
-        with Cluster("Telemetry", graph_attr=CLUSTER_BACKEND):
-            serilog = Csharp("Serilog")
-            otel_traces = Csharp("Tracing")
-            otel_metrics = Csharp("Metrics")
-        
-        # Development
-        with Cluster("Development", graph_attr=CLUSTER_AZURE):
-            aspire = ApplicationInsights("Aspire")
-        
-        # Production
-        with Cluster("Production", graph_attr=CLUSTER_OBSERVABILITY):
-            app_insights = ApplicationInsights("App Insights")
-            azure_monitor = Monitor("Monitor")
-        
-        # Connections
-        webapi >> serilog
-        webapi >> otel_traces
-        webapi >> otel_metrics
-        
-        serilog >> Edge(label="OTLP") >> aspire
-        otel_traces >> aspire
-        otel_metrics >> aspire
-        
-        serilog >> Edge(style="dashed") >> app_insights
-        otel_traces >> Edge(style="dashed") >> app_insights
-        otel_metrics >> Edge(style="dashed") >> azure_monitor
-
-
-def create_content_safety_diagram():
-    """Create Content Safety Flow diagram."""
-    
-    safety_graph = {**GRAPH_ATTR, "nodesep": "0.6", "ranksep": "0.6", "splines": "polyline"}
-    
-    with Diagram(
-        "TaskAgent - Content Safety",
+# Small LR flow graphs - fdp's spring layout skips dot's expensive
+# network-simplex ranking. Unlike neato, fdp still lays out
+# subgraph cluster_* groupings, which these two diagrams are built
+# around. fdp routes splines differently, so the straight-line setting
+# is replaced with plain curved splines; the dot-only nodesep/ranksep
+# knobs are dropped as no-ops under a spring engine.
+SSE_GRAPH_ATTR = MappingProxyType({
+    **GRAPH_ATTR,
+    "layout": "fdp",
+    "splines": "true",
+    "overlap": "false",
+})
+
+SAFETY_GRAPH_ATTR = MappingProxyType({
+    **GRAPH_ATTR,
+    "layout": "fdp",
+    "splines": "true",
+    "overlap": "false",
+})
+
+EVENT_GRAPH_ATTR = MappingProxyType({
+    "fontsize": "18",
+    "fontname": "Helvetica-Bold",
+    "bgcolor": "white",
+    "nodesep": "0.6",  # Horizontal space between nodes
+    "ranksep": "0.4",  # Minimal vertical space
+    "splines": "spline",  # Curved lines - more compact than ortho
+    "pad": "0.1",
+})
+
+EVENT_NODE_ATTR = MappingProxyType({
+    **NODE_ATTR,
+    "fontsize": "11",
+    "labelloc": "b",
+})
+
+
+# The diagrams library assigns a random uuid4 hex to every node, so the raw
+# DOT source differs between otherwise identical runs. Rewrite the IDs to
+# stable sequential ones (in order of appearance) before hashing. Graphviz
+# quotes IDs that happen to start with a digit, so quotes are dropped too -
+# the canonical form is only hashed, never rendered.
+_NODE_ID = re.compile(r'"?\b([0-9a-f]{32})\b"?')
+
+
+def _canonical_dot(source):
+    """Return the DOT source with per-run random node IDs normalized."""
+    ids = {}
+    return _NODE_ID.sub(lambda m: ids.setdefault(m.group(1), f"n{len(ids)}"), source)
+
+
+# Output formats emitted for every diagram, overridable via a
+# comma-separated DIAGRAM_FMT env var. The default keeps PNG for GitHub
+# previews plus SVG for crisp docs rendering; DIAGRAM_FMT=svg skips the
+# raster pipeline entirely, and extra encoders (e.g. png,svg,pdf) are
+# nearly free: the DOT source is generated once per diagram and a single
+# dot invocation emits every format from the same layout, so adding a
+# format costs only its output encoder, never another layout.
+FORMATS = tuple(
+    fmt.strip().lower()
+    for fmt in os.environ.get("DIAGRAM_FMT", "png,svg").split(",")
+    if fmt.strip()
+)
+
+# Diagrams whose DOT source changed since the last run, queued by
+# CachedDiagram.__exit__ and rendered together by render_pending().
+_PENDING = []
+
+# Set by --force: bypass the timestamp gate and the content-hash cache.
+_FORCE = False
+
+# Set by --rich: render the C4 context diagram through Graphviz (icons
+# and PNG output) instead of the hand-written SVG template.
+_RICH_CONTEXT = False
+
+# Base paths written directly from SVG templates, bypassing Graphviz.
+_TEMPLATED = []
+
+
+class CachedDiagram(Diagram):
+    """Diagram that defers rendering and skips unchanged sources.
+
+    On exit the generated DOT source is hashed and compared against a
+    `<filename>.hash` sidecar left by the previous run. If the hash
+    matches and the output files still exist, the diagram is dropped
+    entirely; otherwise its DOT source is queued in memory so that
+    render_pending() can pipe every stale diagram straight to Graphviz
+    over stdin, without ever writing intermediate .gv files to disk.
+    """
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        digest = hashlib.blake2b(_canonical_dot(self.dot.source).encode("utf-8")).hexdigest()
+        formats = self.outformat if isinstance(self.outformat, list) else [self.outformat]
+        outputs = [f"{self.filename}.{fmt}" for fmt in formats]
+
+        if not _FORCE and all(os.path.exists(output) for output in outputs):
+            try:
+                with open(f"{self.filename}.hash") as f:
+                    cached = f.read().strip()
+            except OSError:
+                cached = None
+            if cached == digest:
+                setdiagram(None)
+                return
+
+        _PENDING.append((self.filename, self.dot.source, digest))
+        setdiagram(None)
+
+
+def _up_to_date(name):
+    """Return True when every output for *name* is newer than this script.
+
+    Cheap make-style gate: one stat per file, no DOT generation and no
+    hashing. The content-hash cache in CachedDiagram still catches the
+    finer case where the script changed but a given diagram didn't.
+    """
+    try:
+        script_mtime = os.path.getmtime(__file__)
+        return all(
+            os.path.getmtime(f"{OUTPUT_PATHS[name]}.{fmt}") >= script_mtime
+            for fmt in FORMATS
+        )
+    except OSError:
+        return False
+
+
+def _render_source(job):
+    """Pipe one diagram's DOT source to `dot` over stdin.
+
+    Every format in FORMATS gets an explicit `-T<fmt> -o <file>.<fmt>`
+    pair, so nothing ever touches disk except the final outputs.
+    """
+    filename, source = job
+    cmd = ["dot"]
+    for fmt in FORMATS:
+        cmd += [f"-T{fmt}", "-o", f"{filename}.{fmt}"]
+    subprocess.run(cmd, input=source.encode("utf-8"), check=True)
+
+
+def render_pending():
+    """Render every queued diagram, fanned out across CPU cores.
+
+    The stale diagrams are independent single-threaded `dot` renders, so
+    they are distributed over a ProcessPoolExecutor; each layout is
+    still computed exactly once and emits every format in FORMATS. A
+    per-diagram "layout" graph attr (e.g. neato) still wins over the dot
+    default because it is embedded in the source. Returns the rendered
+    base filenames.
+    """
+    if not _PENDING:
+        return []
+
+    jobs = [(filename, source) for filename, source, _ in _PENDING]
+    max_workers = min(len(jobs), os.cpu_count() or 1)
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_render_source, jobs))
+    else:
+        for job in jobs:
+            _render_source(job)
+
+    rendered = []
+    for filename, _, digest in _PENDING:
+        with open(f"{filename}.hash", "w") as f:
+            f.write(digest)
+        rendered.append(filename)
+    _PENDING.clear()
+    return rendered
+
+
+def chain(*nodes, **edge_attrs):
+    """Connect *nodes* in sequence with one graph.edge call per pair.
+
+    Equivalent to `a >> b >> c` but skips the per-`>>` Edge object and
+    operator dispatch, writing each adjacent pair straight into the
+    active diagram's Digraph. A node may appear more than once to draw
+    back edges within the same chain.
+    """
+    dot = getdiagram().dot
+    for tail, head in zip(nodes, nodes[1:]):
+        dot.edge(tail.nodeid, head.nodeid, **edge_attrs)
+
+
+# ==============================================================================
+# Declarative diagram specs
+# Each diagram is plain data: nodes and clusters in declaration order,
+# plus the edge list. render_spec() walks a spec inside CachedDiagram,
+# so caching, batching, and format handling live in exactly one place.
+# ==============================================================================
+
+@dataclass(frozen=True)
+class NodeSpec:
+    """One node: *ref* keys the edge list, *icon* is a dotted path under diagrams."""
+    ref: str
+    icon: str
+    label: str
+
+
+@dataclass(frozen=True)
+class ClusterSpec:
+    """A cluster whose *body* holds NodeSpecs and nested ClusterSpecs in order."""
+    label: str
+    body: tuple
+    graph_attr: object = None
+
+
+@dataclass(frozen=True)
+class EdgeSpec:
+    """A chain of two or more node refs sharing one set of edge attrs."""
+    refs: tuple
+    attrs: object = None
+
+
+@dataclass(frozen=True)
+class DiagramSpec:
+    """Everything needed to build one diagram, including its output name.
+
+    *template*, when set, is a zero-argument writer that emits the
+    output directly (no Graphviz) unless --rich asks for the full
+    rendered version.
+    """
+    name: str
+    title: str
+    body: tuple
+    edges: tuple
+    direction: str = "TB"
+    # None means the shared GRAPH_ATTR/NODE_ATTR/EDGE_ATTR defaults
+    graph_attr: object = None
+    node_attr: object = None
+    edge_attr: object = None
+    template: object = None
+
+
+@lru_cache(maxsize=None)
+def _icon_class(path):
+    """Resolve e.g. "azure.ml.AzureOpenAI" to its node class, importing lazily."""
+    module, _, name = path.rpartition(".")
+    return getattr(import_module(f"diagrams.{module}"), name)
+
+
+def _instantiate(body, nodes):
+    """Create the nodes and clusters of *body* in declaration order."""
+    for item in body:
+        if isinstance(item, ClusterSpec):
+            with Cluster(item.label, graph_attr=item.graph_attr or {}):
+                _instantiate(item.body, nodes)
+        else:
+            nodes[item.ref] = _icon_class(item.icon)(item.label)
+
+
+def render_spec(spec):
+    """Build one DiagramSpec and queue it on the shared render pipeline."""
+    if spec.template is not None and not _RICH_CONTEXT:
+        spec.template()
+        return
+    with CachedDiagram(
+        spec.title,
         show=False,
-        filename=os.path.join(OUTPUT_DIR, "architecture-content-safety"),
-        outformat="png",
-        graph_attr=safety_graph,
-        node_attr=NODE_ATTR,
-        edge_attr=EDGE_ATTR,
-        direction="LR"
+        filename=OUTPUT_PATHS[spec.name],
+        outformat=list(FORMATS),
+        graph_attr=spec.graph_attr or GRAPH_ATTR,
+        node_attr=spec.node_attr or NODE_ATTR,
+        edge_attr=spec.edge_attr or EDGE_ATTR,
+        direction=spec.direction,
     ):
-        # User
-        user = User("User")
-        
-        # Frontend
-        with Cluster("Frontend", graph_attr=CLUSTER_FRONTEND):
-            chat_input = NextJs("Input")
-            chat_message = NextJs("Output")
-        
-        # Backend
-        with Cluster("Backend", graph_attr=CLUSTER_BACKEND):
-            agent_service = DotNet("Service")
-        
-        # Azure OpenAI
-        with Cluster("Azure OpenAI", graph_attr=CLUSTER_AZURE):
-            openai = AzureOpenAI("GPT-4o-mini")
-            content_filter = CognitiveServices("Filter")
-        
-        # User flow
-        user >> chat_input
-        
-        # Happy path (green)
-        chat_input >> agent_service
-        agent_service >> openai >> content_filter
-        content_filter >> Edge(color="#4caf50") >> agent_service
-        agent_service >> Edge(color="#4caf50") >> chat_message
-        
-        # Blocked path (red) - simplified
-        content_filter >> Edge(color="#f44336", style="dashed") >> chat_message
+        nodes = {}
+        _instantiate(spec.body, nodes)
+        for edge in spec.edges:
+            chain(*(nodes[ref] for ref in edge.refs), **(edge.attrs or {}))
+
+
+# Clean Architecture dependency-edge styles, one per source layer
+_DEP_PRESENTATION = MappingProxyType({"style": "dashed", "color": "#1976d2"})
+_DEP_INFRASTRUCTURE = MappingProxyType({"style": "dashed", "color": "#388e3c"})
+_DEP_APPLICATION = MappingProxyType({"style": "dashed", "color": "#f57c00"})
+
+
+SPEC_MAIN = DiagramSpec(
+    name="architecture-main",
+    title="TaskAgent - AI-Powered Task Management",
+    graph_attr=MAIN_GRAPH_ATTR,
+    body=(
+        NodeSpec("user", "onprem.client.User", "User"),
+        ClusterSpec("Frontend (Next.js 16)", (
+            NodeSpec("nextjs", "programming.framework.NextJs", "App Router"),
+            NodeSpec("chat_ui", "programming.language.Typescript", "Chat UI"),
+            NodeSpec("sse_client", "programming.language.Typescript", "SSE Client"),
+        ), graph_attr=CLUSTER_FRONTEND),
+        ClusterSpec("Backend (.NET 10)", (
+            NodeSpec("webapi", "programming.framework.DotNet", "Web API"),
+            NodeSpec("agent", "programming.framework.DotNet", "Agent Framework"),
+            NodeSpec("functions", "programming.language.Csharp", "Function Tools"),
+        ), graph_attr=CLUSTER_BACKEND),
+        ClusterSpec("Databases", (
+            NodeSpec("sqlserver", "azure.database.SQLDatabases", "SQL Server"),
+            NodeSpec("postgres", "azure.database.DatabaseForPostgresqlServers", "PostgreSQL"),
+        ), graph_attr=CLUSTER_DATABASE),
+        ClusterSpec("Azure Services", (
+            NodeSpec("openai", "azure.ml.AzureOpenAI", "GPT-4o-mini"),
+            NodeSpec("appinsights", "azure.devops.ApplicationInsights", "App Insights"),
+        ), graph_attr=CLUSTER_AZURE),
+    ),
+    edges=(
+        EdgeSpec(("user", "nextjs", "chat_ui", "sse_client")),
+        EdgeSpec(("sse_client", "webapi"), {"label": "SSE Stream", "fontsize": "11"}),
+        EdgeSpec(("webapi", "agent", "functions")),
+        EdgeSpec(("functions", "sqlserver")),
+        EdgeSpec(("agent", "postgres")),
+        EdgeSpec(("agent", "openai")),
+        EdgeSpec(("webapi", "appinsights")),
+    ),
+)
+
+
+SPEC_CLEAN = DiagramSpec(
+    name="architecture-clean",
+    title="TaskAgent - Clean Architecture",
+    graph_attr=CLEAN_GRAPH_ATTR,
+    body=(
+        ClusterSpec("Presentation (WebApi)", (
+            NodeSpec("controllers", "programming.framework.DotNet", "Controllers"),
+            NodeSpec("streaming", "programming.framework.DotNet", "SSE Service"),
+            NodeSpec("middleware", "programming.framework.DotNet", "Middleware"),
+        ), graph_attr=LAYER_PRESENTATION),
+        ClusterSpec("Infrastructure", (
+            NodeSpec("dbcontext", "programming.language.Csharp", "DbContexts"),
+            NodeSpec("repositories", "programming.language.Csharp", "Repositories"),
+            NodeSpec("services", "programming.language.Csharp", "Services"),
+        ), graph_attr=LAYER_INFRASTRUCTURE),
+        ClusterSpec("Application", (
+            NodeSpec("dtos", "programming.language.Csharp", "DTOs"),
+            NodeSpec("interfaces", "programming.language.Csharp", "Interfaces"),
+            NodeSpec("functions", "programming.language.Csharp", "Functions (6)"),
+            NodeSpec("telemetry", "programming.language.Csharp", "Telemetry"),
+        ), graph_attr=LAYER_APPLICATION),
+        ClusterSpec("Domain", (
+            NodeSpec("entities", "programming.language.Csharp", "Entities"),
+            NodeSpec("enums", "programming.language.Csharp", "Enums"),
+            NodeSpec("rules", "programming.language.Csharp", "Business Rules"),
+        ), graph_attr=LAYER_DOMAIN),
+    ),
+    # Dependency flow (downward only - Clean Architecture)
+    edges=(
+        EdgeSpec(("controllers", "services"), _DEP_PRESENTATION),
+        EdgeSpec(("streaming", "services"), _DEP_PRESENTATION),
+        EdgeSpec(("dbcontext", "interfaces"), _DEP_INFRASTRUCTURE),
+        EdgeSpec(("repositories", "interfaces"), _DEP_INFRASTRUCTURE),
+        EdgeSpec(("services", "functions"), _DEP_INFRASTRUCTURE),
+        EdgeSpec(("dtos", "entities"), _DEP_APPLICATION),
+        EdgeSpec(("interfaces", "entities"), _DEP_APPLICATION),
+        EdgeSpec(("functions", "entities"), _DEP_APPLICATION),
+    ),
+)
+
+
+SPEC_SSE_FLOW = DiagramSpec(
+    name="architecture-sse-flow",
+    title="TaskAgent - SSE Event Flow",
+    direction="LR",
+    graph_attr=SSE_GRAPH_ATTR,
+    body=(
+        ClusterSpec("Frontend", (
+            NodeSpec("chat_input", "programming.framework.NextJs", "ChatInput"),
+            NodeSpec("use_chat", "programming.language.Typescript", "useChat"),
+            NodeSpec("messages", "programming.framework.NextJs", "Messages"),
+        ), graph_attr=CLUSTER_FRONTEND),
+        ClusterSpec("Backend", (
+            NodeSpec("controller", "programming.framework.DotNet", "Controller"),
+            NodeSpec("agent_service", "programming.framework.DotNet", "Streaming"),
+            NodeSpec("agent", "programming.language.Csharp", "Agent"),
+        ), graph_attr=CLUSTER_BACKEND),
+        ClusterSpec("SSE", (
+            NodeSpec("sse_events", "generic.compute.Rack", "Events"),
+        ), graph_attr=CLUSTER_AZURE),
+    ),
+    edges=(
+        EdgeSpec(("chat_input", "use_chat", "controller", "agent_service", "agent")),
+        EdgeSpec(("agent", "sse_events"), {"style": "dashed"}),
+        EdgeSpec(("sse_events", "messages"), {"color": "#1976d2"}),
+    ),
+)
+
+
+SPEC_DUAL_DATABASE = DiagramSpec(
+    name="architecture-dual-database",
+    title="TaskAgent - Dual Database",
+    graph_attr=RANKSEP_07_GRAPH_ATTR,
+    body=(
+        NodeSpec("agent", "programming.framework.DotNet", "Agent Framework"),
+        ClusterSpec("SQL Server (Tasks)", (
+            NodeSpec("task_repo", "programming.language.Csharp", "Repository"),
+            NodeSpec("task_context", "programming.language.Csharp", "DbContext"),
+            NodeSpec("task_table", "azure.database.SQLDatabases", "Tasks"),
+        ), graph_attr=CLUSTER_DATABASE_BLUE),
+        ClusterSpec("PostgreSQL (Chats)", (
+            NodeSpec("thread_service", "programming.language.Csharp", "Persistence"),
+            NodeSpec("conv_context", "programming.language.Csharp", "DbContext"),
+            NodeSpec("conv_table", "azure.database.DatabaseForPostgresqlServers", "Threads"),
+        ), graph_attr=CLUSTER_DATABASE_GREEN),
+    ),
+    edges=(
+        EdgeSpec(("agent", "task_repo"), {"label": "Tasks"}),
+        EdgeSpec(("task_repo", "task_context", "task_table")),
+        EdgeSpec(("agent", "thread_service"), {"label": "Chats"}),
+        EdgeSpec(("thread_service", "conv_context", "conv_table")),
+    ),
+)
+
+
+SPEC_OBSERVABILITY = DiagramSpec(
+    name="architecture-observability",
+    title="TaskAgent - Observability",
+    graph_attr=OBSERVABILITY_GRAPH_ATTR,
+    body=(
+        NodeSpec("webapi", "programming.framework.DotNet", "WebApi"),
+        ClusterSpec("Telemetry", (
+            NodeSpec("serilog", "programming.language.Csharp", "Serilog"),
+            NodeSpec("otel_traces", "programming.language.Csharp", "Tracing"),
+            NodeSpec("otel_metrics", "programming.language.Csharp", "Metrics"),
+        ), graph_attr=CLUSTER_BACKEND),
+        ClusterSpec("Development", (
+            NodeSpec("aspire", "azure.devops.ApplicationInsights", "Aspire"),
+        ), graph_attr=CLUSTER_AZURE),
+        ClusterSpec("Production", (
+            NodeSpec("app_insights", "azure.devops.ApplicationInsights", "App Insights"),
+            NodeSpec("azure_monitor", "azure.monitor.Monitor", "Monitor"),
+        ), graph_attr=CLUSTER_OBSERVABILITY),
+    ),
+    edges=(
+        EdgeSpec(("webapi", "serilog")),
+        EdgeSpec(("webapi", "otel_traces")),
+        EdgeSpec(("webapi", "otel_metrics")),
+        EdgeSpec(("serilog", "aspire"), {"label": "OTLP"}),
+        EdgeSpec(("otel_traces", "aspire")),
+        EdgeSpec(("otel_metrics", "aspire")),
+        EdgeSpec(("serilog", "app_insights"), {"style": "dashed"}),
+        EdgeSpec(("otel_traces", "app_insights"), {"style": "dashed"}),
+        EdgeSpec(("otel_metrics", "azure_monitor"), {"style": "dashed"}),
+    ),
+)
+
+
+SPEC_CONTENT_SAFETY = DiagramSpec(
+    name="architecture-content-safety",
+    title="TaskAgent - Content Safety",
+    direction="LR",
+    graph_attr=SAFETY_GRAPH_ATTR,
+    body=(
+        NodeSpec("user", "onprem.client.User", "User"),
+        ClusterSpec("Frontend", (
+            NodeSpec("chat_input", "programming.framework.NextJs", "Input"),
+            NodeSpec("chat_message", "programming.framework.NextJs", "Output"),
+        ), graph_attr=CLUSTER_FRONTEND),
+        ClusterSpec("Backend", (
+            NodeSpec("agent_service", "programming.framework.DotNet", "Service"),
+        ), graph_attr=CLUSTER_BACKEND),
+        ClusterSpec("Azure OpenAI", (
+            NodeSpec("openai", "azure.ml.AzureOpenAI", "GPT-4o-mini"),
+            NodeSpec("content_filter", "azure.ml.CognitiveServices", "Filter"),
+        ), graph_attr=CLUSTER_AZURE),
+    ),
+    # Happy path in green, blocked path in red
+    edges=(
+        EdgeSpec(("user", "chat_input", "agent_service", "openai", "content_filter")),
+        EdgeSpec(("content_filter", "agent_service"), {"color": "#4caf50"}),
+        EdgeSpec(("agent_service", "chat_message"), {"color": "#4caf50"}),
+        EdgeSpec(("content_filter", "chat_message"), {"color": "#f44336", "style": "dashed"}),
+    ),
+)
+
+
+SPEC_STREAMING = DiagramSpec(
+    name="architecture-streaming",
+    title="TaskAgent - Streaming Architecture",
+    direction="LR",
+    graph_attr=STREAMING_GRAPH_ATTR,
+    body=(
+        NodeSpec("user", "onprem.client.User", "User"),
+        ClusterSpec("Next.js Frontend", (
+            NodeSpec("use_chat", "programming.language.Typescript", "useChat Hook"),
+            NodeSpec("chat_list", "programming.framework.NextJs", "MessagesList"),
+        ), graph_attr=CLUSTER_FRONTEND),
+        ClusterSpec(".NET Backend", (
+            NodeSpec("controller", "programming.framework.DotNet", "AgentController"),
+            NodeSpec("sse_service", "programming.framework.DotNet", "SseStreamingService"),
+            NodeSpec("agent", "programming.language.Csharp", "AIAgent"),
+        ), graph_attr=CLUSTER_BACKEND),
+        ClusterSpec("Persistence", (
+            NodeSpec("postgres", "azure.database.DatabaseForPostgresqlServers", "PostgreSQL"),
+            NodeSpec("store", "programming.language.Csharp", "ChatMessageStore"),
+        ), graph_attr=CLUSTER_DATABASE),
+    ),
+    edges=(
+        EdgeSpec(("user", "use_chat")),
+        EdgeSpec(("use_chat", "controller"), {"label": "POST /api/agent/chat", "fontsize": "10"}),
+        EdgeSpec(("controller", "sse_service", "agent")),
+        EdgeSpec(("agent", "store", "postgres")),
+        EdgeSpec(("sse_service", "chat_list"),
+                 {"label": "SSE Events", "style": "dashed", "color": "#1976d2", "fontsize": "10"}),
+    ),
+)
+
+
+SPEC_EVENT_TYPES = DiagramSpec(
+    name="architecture-event-types",
+    title="TaskAgent - SSE Event Flow",
+    direction="LR",
+    graph_attr=EVENT_GRAPH_ATTR,
+    node_attr=EVENT_NODE_ATTR,
+    body=(
+        NodeSpec("client", "programming.language.Typescript", "\nClient"),
+        ClusterSpec("SSE Stream", (
+            NodeSpec("msg_start", "programming.language.Csharp", "\nTEXT_START"),
+            NodeSpec("msg_content", "programming.language.Csharp", "\nTEXT_CONTENT"),
+            NodeSpec("tool_call", "programming.language.Csharp", "\nTOOL_CALL"),
+            NodeSpec("tool_result", "programming.language.Csharp", "\nTOOL_RESULT"),
+            NodeSpec("thread_state", "programming.language.Csharp", "\nTHREAD_STATE"),
+        ), graph_attr=CLUSTER_AZURE_COMPACT),
+        NodeSpec("done", "generic.compute.Rack", "\n[DONE]"),
+    ),
+    # Simple linear flow, looping back through TEXT_CONTENT
+    edges=(
+        EdgeSpec(("client", "msg_start", "msg_content", "tool_call", "tool_result",
+                  "msg_content", "thread_state", "done")),
+    ),
+)
 
 
 # ==============================================================================
@@ -530,323 +778,410 @@ def create_content_safety_diagram():
 # ==============================================================================
 
 # C4 color scheme - LIGHT backgrounds for readability
-C4_PERSON = {
+C4_PERSON = MappingProxyType({
     "fontsize": "12",
-    "fontname": "Arial Bold",
+    "fontname": "Helvetica-Bold",
     "fontcolor": "#1a1a1a",
     "style": "rounded",
     "bgcolor": "#cfe2f3",  # Light blue for people
     "penwidth": "2",
     "pencolor": "#08427b",
     "margin": "16",
-}
+})
 
-C4_SYSTEM = {
+C4_SYSTEM = MappingProxyType({
     "fontsize": "12",
-    "fontname": "Arial Bold",
+    "fontname": "Helvetica-Bold",
     "fontcolor": "#1a1a1a",
     "style": "rounded",
     "bgcolor": "#d0e0fc",  # Light blue for systems
     "penwidth": "2",
     "pencolor": "#1168bd",
     "margin": "16",
-}
+})
 
-C4_EXTERNAL = {
+C4_EXTERNAL = MappingProxyType({
     "fontsize": "12",
-    "fontname": "Arial Bold",
+    "fontname": "Helvetica-Bold",
     "fontcolor": "#1a1a1a",
     "style": "rounded",
     "bgcolor": "#e0e0e0",  # Light gray for external systems
     "penwidth": "2",
     "pencolor": "#666666",
     "margin": "16",
-}
+})
 
-C4_CONTAINER = {
+C4_CONTAINER = MappingProxyType({
     "fontsize": "12",
-    "fontname": "Arial Bold",
+    "fontname": "Helvetica-Bold",
     "fontcolor": "#1a1a1a",
     "style": "rounded",
     "bgcolor": "#dbeafe",  # Light blue for containers
     "penwidth": "2",
     "pencolor": "#438dd5",
     "margin": "16",
-}
+})
 
-C4_DATABASE = {
+C4_DATABASE = MappingProxyType({
     "fontsize": "12",
-    "fontname": "Arial Bold",
+    "fontname": "Helvetica-Bold",
     "fontcolor": "#1a1a1a",
     "style": "rounded",
     "bgcolor": "#dbeafe",
     "penwidth": "2",
     "pencolor": "#438dd5",
     "margin": "16",
-}
+})
 
-C4_COMPONENT = {
+C4_COMPONENT = MappingProxyType({
     "fontsize": "11",
-    "fontname": "Arial Bold",
+    "fontname": "Helvetica-Bold",
     "fontcolor": "#1a1a1a",
     "style": "rounded",
     "bgcolor": "#e8f4fc",  # Very light blue for components
     "penwidth": "1",
     "pencolor": "#85bbf0",
     "margin": "12",
-}
+})
 
+# Per-diagram C4 variants, precomputed and frozen like the style dicts above
+C4_CONTEXT_GRAPH_ATTR = MappingProxyType({
+    "fontsize": "20",
+    "fontname": "Helvetica-Bold",
+    "bgcolor": "white",
+    "pad": "0.5",
+    "splines": "ortho",
+    "nodesep": "1.0",
+    "ranksep": "1.2",
+})
 
-def create_c4_context_diagram():
-    """
-    C4 Level 1: System Context Diagram
-    Shows TaskAgent system in relation to users and external systems.
-    """
-    
-    c4_graph = {
-        "fontsize": "20",
-        "fontname": "Arial Bold",
-        "bgcolor": "white",
-        "pad": "0.5",
-        "splines": "ortho",
-        "nodesep": "1.0",
-        "ranksep": "1.2",
-    }
-    
-    with Diagram(
-        "TaskAgent - C4 Level 1: System Context",
-        show=False,
-        filename=os.path.join(OUTPUT_DIR, "c4-1-context"),
-        outformat="png",
-        graph_attr=c4_graph,
-        node_attr=NODE_ATTR,
-        edge_attr=EDGE_ATTR,
-        direction="TB"
-    ):
-        # Person (User)
-        with Cluster("", graph_attr=C4_PERSON):
-            user = User("User")
-        
-        # Main System
-        with Cluster("TaskAgent System", graph_attr=C4_SYSTEM):
-            task_agent = DotNet("AI Task Manager")
-        
-        # External Systems
-        with Cluster("Azure OpenAI [External]", graph_attr=C4_EXTERNAL):
-            azure_openai = AzureOpenAI("GPT-4o-mini")
-        
-        with Cluster("Azure Monitor [External]", graph_attr=C4_EXTERNAL):
-            app_insights = ApplicationInsights("Telemetry")
-        
-        # Relationships
-        user >> Edge(label="Manages tasks via\nnatural language", fontsize="10") >> task_agent
-        task_agent >> Edge(label="Generates responses\n& executes functions", fontsize="10") >> azure_openai
-        task_agent >> Edge(label="Sends logs,\ntraces, metrics", fontsize="10", style="dashed") >> app_insights
-
-
-def create_c4_container_diagram():
-    """
-    C4 Level 2: Container Diagram
-    Shows the high-level technical building blocks.
-    """
-    
-    c4_graph = {
-        "fontsize": "20",
-        "fontname": "Arial Bold",
-        "bgcolor": "white",
-        "pad": "0.5",
-        "splines": "polyline",  # Better for label positioning
-        "nodesep": "1.2",  # More horizontal space for labels
-        "ranksep": "1.0",
-    }
-    
-    # Edge attr with more label distance
-    c4_edge_attr = {
-        **EDGE_ATTR,
-        "labeldistance": "2.5",
-        "labelangle": "25",
-    }
-    
-    with Diagram(
-        "TaskAgent - C4 Level 2: Container",
-        show=False,
-        filename=os.path.join(OUTPUT_DIR, "c4-2-container"),
-        outformat="png",
-        graph_attr=c4_graph,
-        node_attr=NODE_ATTR,
-        edge_attr=c4_edge_attr,
-        direction="TB"
-    ):
-        # User
-        user = User("User")
-        
-        # Containers
-        with Cluster("Frontend Container", graph_attr=C4_CONTAINER):
-            frontend = NextJs("Next.js 16\n[TypeScript]")
-        
-        with Cluster("Backend Container", graph_attr=C4_CONTAINER):
-            backend = DotNet(".NET 10 API\n[C#]")
-        
-        with Cluster("Task Database", graph_attr=C4_DATABASE):
-            sql_server = SQLDatabases("SQL Server\n[Tasks]")
-        
-        with Cluster("Chat Database", graph_attr=C4_DATABASE):
-            postgres = DatabaseForPostgresqlServers("PostgreSQL\n[Conversations]")
-        
-        # External
-        with Cluster("Azure OpenAI", graph_attr=C4_EXTERNAL):
-            openai = AzureOpenAI("GPT-4o-mini")
-        
-        # Relationships - use xlabel for external labels that don't overlap arrows
-        user >> frontend
-        frontend >> Edge(xlabel="  SSE/REST  ", fontsize="10") >> backend
-        backend >> Edge(xlabel="  EF Core  ", fontsize="10") >> sql_server
-        backend >> Edge(xlabel="  EF Core  ", fontsize="10") >> postgres
-        backend >> Edge(xlabel="  SDK  ", fontsize="10") >> openai
-
-
-def create_c4_component_diagram():
-    """
-    C4 Level 3: Component Diagram (Backend)
-    Shows components inside the .NET Backend container.
-    """
-    
-    c4_graph = {
-        "fontsize": "18",
-        "fontname": "Arial Bold",
-        "bgcolor": "white",
-        "pad": "0.5",
-        "splines": "spline",  # Curved splines for cleaner look
-        "nodesep": "0.6",
-        "ranksep": "0.8",
-    }
-    
-    with Diagram(
-        "TaskAgent - C4 Level 3: Backend Components",
-        show=False,
-        filename=os.path.join(OUTPUT_DIR, "c4-3-component-backend"),
-        outformat="png",
-        graph_attr=c4_graph,
-        node_attr={**NODE_ATTR, "fontsize": "10"},
-        edge_attr={**EDGE_ATTR, "fontsize": "9"},
-        direction="TB"
-    ):
-        # Entry points
-        frontend = NextJs("Frontend")
-        
-        # Backend boundary
-        with Cluster("Backend API [.NET 10]", graph_attr={**C4_CONTAINER, "bgcolor": "#e3f2fd", "fontcolor": "#1a1a1a"}):
-            
-            # Presentation
-            with Cluster("Presentation", graph_attr={**C4_COMPONENT, "bgcolor": "#bbdefb", "fontcolor": "#1a1a1a"}):
-                agent_ctrl = DotNet("AgentController")
-                sse_svc = DotNet("SseStreaming")
-            
-            # Application
-            with Cluster("Application", graph_attr={**C4_COMPONENT, "bgcolor": "#c8e6c9", "fontcolor": "#1a1a1a"}):
-                functions = Csharp("TaskFunctions")
-                telemetry = Csharp("Telemetry")
-            
-            # Infrastructure
-            with Cluster("Infrastructure", graph_attr={**C4_COMPONENT, "bgcolor": "#ffe0b2", "fontcolor": "#1a1a1a"}):
-                agent_svc = DotNet("AgentStreaming")
-                task_repo = Csharp("TaskRepository")
-                msg_store = Csharp("ChatMessageStore")
-        
+C4_CONTAINER_GRAPH_ATTR = MappingProxyType({
+    "fontsize": "20",
+    "fontname": "Helvetica-Bold",
+    "bgcolor": "white",
+    "pad": "0.5",
+    "splines": "polyline",  # Better for label positioning
+    "nodesep": "1.2",  # More horizontal space for labels
+    "ranksep": "1.0",
+})
+
+# Edge attr with more label distance
+C4_CONTAINER_EDGE_ATTR = MappingProxyType({
+    **EDGE_ATTR,
+    "labeldistance": "2.5",
+    "labelangle": "25",
+})
+
+C4_COMPONENT_GRAPH_ATTR = MappingProxyType({
+    "fontsize": "18",
+    "fontname": "Helvetica-Bold",
+    "bgcolor": "white",
+    "pad": "0.5",
+    "splines": "spline",  # Curved splines for cleaner look
+    "nodesep": "0.6",
+    "ranksep": "0.8",
+    "concentrate": "true",  # Merge parallel edges before routing
+})
+
+C4_COMPONENT_NODE_ATTR = MappingProxyType({**NODE_ATTR, "fontsize": "10"})
+C4_COMPONENT_EDGE_ATTR = MappingProxyType({**EDGE_ATTR, "fontsize": "9"})
+
+C4_BACKEND_BOUNDARY = MappingProxyType({**C4_CONTAINER, "bgcolor": "#e3f2fd", "fontcolor": "#1a1a1a"})
+C4_LAYER_PRESENTATION = MappingProxyType({**C4_COMPONENT, "bgcolor": "#bbdefb", "fontcolor": "#1a1a1a"})
+C4_LAYER_APPLICATION = MappingProxyType({**C4_COMPONENT, "bgcolor": "#c8e6c9", "fontcolor": "#1a1a1a"})
+C4_LAYER_INFRASTRUCTURE = MappingProxyType({**C4_COMPONENT, "bgcolor": "#ffe0b2", "fontcolor": "#1a1a1a"})
+
+
+# Hand-written SVG for the C4 context diagram: 4 boxes and 3 arrows do
+# not need a layout engine, so by default the file comes straight from
+# this template instead of a Graphviz run.
+C4_CONTEXT_SVG = """\
+<svg xmlns="http://www.w3.org/2000/svg" width="680" height="560" viewBox="0 0 680 560"
+     font-family="Helvetica, Arial, sans-serif">
+  <rect width="680" height="560" fill="white"/>
+  <text x="340" y="32" text-anchor="middle" font-size="18" font-weight="bold">{title}</text>
+
+  <defs>
+    <marker id="arrow" markerWidth="8" markerHeight="8" refX="7" refY="3"
+            orient="auto" markerUnits="strokeWidth">
+      <path d="M0,0 L7,3 L0,6 z" fill="#555555"/>
+    </marker>
+  </defs>
+
+  <!-- Person -->
+  <rect x="270" y="60" width="140" height="60" rx="8" fill="#08427b"/>
+  <text x="340" y="85" text-anchor="middle" font-size="13" fill="white" font-weight="bold">{user_label}</text>
+  <text x="340" y="104" text-anchor="middle" font-size="10" fill="#d0d8e8">[Person]</text>
+
+  <!-- TaskAgent system -->
+  <rect x="255" y="230" width="170" height="70" rx="4" fill="#1168bd"/>
+  <text x="340" y="258" text-anchor="middle" font-size="13" fill="white" font-weight="bold">{system_label}</text>
+  <text x="340" y="278" text-anchor="middle" font-size="10" fill="#d0d8e8">[Software System]</text>
+
+  <!-- External systems -->
+  <rect x="70" y="430" width="170" height="70" rx="4" fill="#999999"/>
+  <text x="155" y="458" text-anchor="middle" font-size="13" fill="white" font-weight="bold">{openai_label}</text>
+  <text x="155" y="478" text-anchor="middle" font-size="10" fill="#eeeeee">Azure OpenAI [External]</text>
+
+  <rect x="440" y="430" width="170" height="70" rx="4" fill="#999999"/>
+  <text x="525" y="458" text-anchor="middle" font-size="13" fill="white" font-weight="bold">{insights_label}</text>
+  <text x="525" y="478" text-anchor="middle" font-size="10" fill="#eeeeee">Azure Monitor [External]</text>
+
+  <!-- Relationships -->
+  <line x1="340" y1="120" x2="340" y2="230" stroke="#555555" marker-end="url(#arrow)"/>
+  <text x="348" y="170" font-size="10" fill="#555555">Manages tasks via</text>
+  <text x="348" y="183" font-size="10" fill="#555555">natural language</text>
+
+  <line x1="290" y1="300" x2="175" y2="430" stroke="#555555" marker-end="url(#arrow)"/>
+  <text x="120" y="360" font-size="10" fill="#555555">Generates responses</text>
+  <text x="120" y="373" font-size="10" fill="#555555">&amp; executes functions</text>
+
+  <line x1="390" y1="300" x2="505" y2="430" stroke="#555555" stroke-dasharray="5,3"
+        marker-end="url(#arrow)"/>
+  <text x="462" y="360" font-size="10" fill="#555555">Sends logs,</text>
+  <text x="462" y="373" font-size="10" fill="#555555">traces, metrics</text>
+</svg>
+"""
+
+
+def _write_c4_context_svg():
+    """Emit the C4 context SVG straight from the template."""
+    path = Path(f"{OUTPUT_PATHS['c4-1-context']}.svg")
+    svg = C4_CONTEXT_SVG.format(
+        title="TaskAgent - C4 Level 1: System Context",
+        user_label="User",
+        system_label="AI Task Manager",
+        openai_label="GPT-4o-mini",
+        insights_label="Telemetry",
+    )
+    if _FORCE or not path.exists() or path.read_text() != svg:
+        path.write_text(svg)
+        _TEMPLATED.append(str(path.with_suffix("")))
+
+
+SPEC_C4_CONTEXT = DiagramSpec(
+    name="c4-1-context",
+    title="TaskAgent - C4 Level 1: System Context",
+    graph_attr=C4_CONTEXT_GRAPH_ATTR,
+    # Four nodes and three edges don't need a layout engine: the
+    # template writer emits the SVG directly unless --rich is given.
+    template=_write_c4_context_svg,
+    body=(
+        ClusterSpec("", (
+            NodeSpec("user", "onprem.client.User", "User"),
+        ), graph_attr=C4_PERSON),
+        ClusterSpec("TaskAgent System", (
+            NodeSpec("task_agent", "programming.framework.DotNet", "AI Task Manager"),
+        ), graph_attr=C4_SYSTEM),
+        ClusterSpec("Azure OpenAI [External]", (
+            NodeSpec("azure_openai", "azure.ml.AzureOpenAI", "GPT-4o-mini"),
+        ), graph_attr=C4_EXTERNAL),
+        ClusterSpec("Azure Monitor [External]", (
+            NodeSpec("app_insights", "azure.devops.ApplicationInsights", "Telemetry"),
+        ), graph_attr=C4_EXTERNAL),
+    ),
+    edges=(
+        EdgeSpec(("user", "task_agent"),
+                 {"label": "Manages tasks via\nnatural language", "fontsize": "10"}),
+        EdgeSpec(("task_agent", "azure_openai"),
+                 {"label": "Generates responses\n& executes functions", "fontsize": "10"}),
+        EdgeSpec(("task_agent", "app_insights"),
+                 {"label": "Sends logs,\ntraces, metrics", "fontsize": "10", "style": "dashed"}),
+    ),
+)
+
+
+SPEC_C4_CONTAINER = DiagramSpec(
+    name="c4-2-container",
+    title="TaskAgent - C4 Level 2: Container",
+    graph_attr=C4_CONTAINER_GRAPH_ATTR,
+    edge_attr=C4_CONTAINER_EDGE_ATTR,
+    body=(
+        NodeSpec("user", "onprem.client.User", "User"),
+        ClusterSpec("Frontend Container", (
+            NodeSpec("frontend", "programming.framework.NextJs", "Next.js 16\n[TypeScript]"),
+        ), graph_attr=C4_CONTAINER),
+        ClusterSpec("Backend Container", (
+            NodeSpec("backend", "programming.framework.DotNet", ".NET 10 API\n[C#]"),
+        ), graph_attr=C4_CONTAINER),
+        ClusterSpec("Task Database", (
+            NodeSpec("sql_server", "azure.database.SQLDatabases", "SQL Server\n[Tasks]"),
+        ), graph_attr=C4_DATABASE),
+        ClusterSpec("Chat Database", (
+            NodeSpec("postgres", "azure.database.DatabaseForPostgresqlServers",
+                     "PostgreSQL\n[Conversations]"),
+        ), graph_attr=C4_DATABASE),
+        ClusterSpec("Azure OpenAI", (
+            NodeSpec("openai", "azure.ml.AzureOpenAI", "GPT-4o-mini"),
+        ), graph_attr=C4_EXTERNAL),
+    ),
+    # xlabel keeps the external labels from overlapping the arrows
+    edges=(
+        EdgeSpec(("user", "frontend")),
+        EdgeSpec(("frontend", "backend"), {"xlabel": "  SSE/REST  ", "fontsize": "10"}),
+        EdgeSpec(("backend", "sql_server"), {"xlabel": "  EF Core  ", "fontsize": "10"}),
+        EdgeSpec(("backend", "postgres"), {"xlabel": "  EF Core  ", "fontsize": "10"}),
+        EdgeSpec(("backend", "openai"), {"xlabel": "  SDK  ", "fontsize": "10"}),
+    ),
+)
+
+
+SPEC_C4_COMPONENT = DiagramSpec(
+    name="c4-3-component-backend",
+    title="TaskAgent - C4 Level 3: Backend Components",
+    graph_attr=C4_COMPONENT_GRAPH_ATTR,
+    node_attr=C4_COMPONENT_NODE_ATTR,
+    edge_attr=C4_COMPONENT_EDGE_ATTR,
+    body=(
+        NodeSpec("frontend", "programming.framework.NextJs", "Frontend"),
+        ClusterSpec("Backend API [.NET 10]", (
+            ClusterSpec("Presentation", (
+                NodeSpec("agent_ctrl", "programming.framework.DotNet", "AgentController"),
+                NodeSpec("sse_svc", "programming.framework.DotNet", "SseStreaming"),
+            ), graph_attr=C4_LAYER_PRESENTATION),
+            ClusterSpec("Application", (
+                NodeSpec("functions", "programming.language.Csharp", "TaskFunctions"),
+                NodeSpec("telemetry", "programming.language.Csharp", "Telemetry"),
+            ), graph_attr=C4_LAYER_APPLICATION),
+            ClusterSpec("Infrastructure", (
+                NodeSpec("agent_svc", "programming.framework.DotNet", "AgentStreaming"),
+                NodeSpec("task_repo", "programming.language.Csharp", "TaskRepository"),
+                NodeSpec("msg_store", "programming.language.Csharp", "ChatMessageStore"),
+            ), graph_attr=C4_LAYER_INFRASTRUCTURE),
+        ), graph_attr=C4_BACKEND_BOUNDARY),
         # External systems in a vertical cluster to reduce width
-        with Cluster("External Services", graph_attr={"style": "invis"}):
-            sql = SQLDatabases("SQL Server")
-            openai = AzureOpenAI("Azure OpenAI")
-            pg = DatabaseForPostgresqlServers("PostgreSQL")
-        
-        # Flow - simplified connections
-        frontend >> agent_ctrl
-        agent_ctrl >> sse_svc
-        sse_svc >> agent_svc
-        agent_svc >> functions
-        functions >> task_repo
-        task_repo >> sql
-        agent_svc >> msg_store
-        msg_store >> pg
-        agent_svc >> openai
+        ClusterSpec("External Services", (
+            NodeSpec("sql", "azure.database.SQLDatabases", "SQL Server"),
+            NodeSpec("openai", "azure.ml.AzureOpenAI", "Azure OpenAI"),
+            NodeSpec("pg", "azure.database.DatabaseForPostgresqlServers", "PostgreSQL"),
+        ), graph_attr=MappingProxyType({"style": "invis"})),
+    ),
+    edges=(
+        EdgeSpec(("frontend", "agent_ctrl", "sse_svc", "agent_svc", "functions",
+                  "task_repo", "sql")),
+        EdgeSpec(("agent_svc", "msg_store", "pg")),
+        EdgeSpec(("agent_svc", "openai")),
+    ),
+)
+
+
+# Every diagram, in output order. Each spec is plain immutable data, so
+# the render loop can apply caching, batching, and parallelism uniformly.
+DIAGRAMS = (
+    SPEC_MAIN,
+    SPEC_CLEAN,
+    SPEC_SSE_FLOW,
+    SPEC_DUAL_DATABASE,
+    SPEC_OBSERVABILITY,
+    SPEC_CONTENT_SAFETY,
+    SPEC_STREAMING,
+    SPEC_EVENT_TYPES,
+    SPEC_C4_CONTEXT,
+    SPEC_C4_CONTAINER,
+    SPEC_C4_COMPONENT,
+)
 
 
 if __name__ == "__main__":
-    print("=" * 60)
-    print("TaskAgent - Architecture Diagram Generator")
-    print("=" * 60)
-    print(f"\nOutput directory: {OUTPUT_DIR}")
-    
+    parser = argparse.ArgumentParser(description="Generate the TaskAgent architecture diagrams.")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="rebuild every diagram, ignoring timestamps and the render cache",
+    )
+    parser.add_argument(
+        "--rich",
+        action="store_true",
+        help="render the C4 context diagram through Graphviz instead of "
+        "the built-in SVG template",
+    )
+    parser.add_argument(
+        "--only",
+        metavar="NAMES",
+        help="comma-separated diagram names to generate "
+        "(e.g. architecture-main,c4-1-context)",
+    )
+    args = parser.parse_args()
+
+    specs = DIAGRAMS
+    if args.only:
+        wanted = {name.strip() for name in args.only.split(",") if name.strip()}
+        unknown = wanted - {spec.name for spec in DIAGRAMS}
+        if unknown:
+            parser.error(f"unknown diagram name(s): {', '.join(sorted(unknown))}")
+        # Only the selected specs are built, so only their node-class
+        # submodules (and icon scans) are ever imported.
+        specs = [spec for spec in DIAGRAMS if spec.name in wanted]
+
+    # Status output is collected and flushed as one write at the end
+    # instead of ~30 individual line-buffered (and locked) print calls.
+    lines = [
+        "=" * 60,
+        "TaskAgent - Architecture Diagram Generator",
+        "=" * 60,
+        f"\nOutput directory: {OUTPUT_DIR}\n",
+    ]
+
     try:
-        print("\n1. Creating main architecture diagram...")
-        create_main_architecture()
-        print("   ✅ architecture-main.png")
-        
-        print("\n2. Creating Clean Architecture layers diagram...")
-        create_clean_architecture()
-        print("   ✅ architecture-clean.png")
-        
-        print("\n3. Creating SSE event flow diagram...")
-        create_sse_flow_diagram()
-        print("   ✅ architecture-sse-flow.png")
-        
-        print("\n4. Creating dual database architecture diagram...")
-        create_dual_database_diagram()
-        print("   ✅ architecture-dual-database.png")
-        
-        print("\n5. Creating observability stack diagram...")
-        create_observability_diagram()
-        print("   ✅ architecture-observability.png")
-        
-        print("\n6. Creating content safety flow diagram...")
-        create_content_safety_diagram()
-        print("   ✅ architecture-content-safety.png")
-        
-        print("\n7. Creating streaming architecture diagram...")
-        create_streaming_architecture()
-        print("   ✅ architecture-streaming.png")
-        
-        print("\n8. Creating event types diagram...")
-        create_event_sequence_diagram()
-        print("   ✅ architecture-event-types.png")
-        
-        print("\n--- C4 Model Diagrams ---")
-        
-        print("\n9. Creating C4 System Context diagram...")
-        create_c4_context_diagram()
-        print("   ✅ c4-1-context.png")
-        
-        print("\n10. Creating C4 Container diagram...")
-        create_c4_container_diagram()
-        print("   ✅ c4-2-container.png")
-        
-        print("\n11. Creating C4 Component diagram (Backend)...")
-        create_c4_component_diagram()
-        print("   ✅ c4-3-component-backend.png")
-        
-        print(f"\n{'=' * 60}")
-        print(f"✅ All diagrams generated in: {OUTPUT_DIR}")
-        print("=" * 60)
-        print("\nArchitecture Diagrams:")
-        print("  📊 architecture-main.png           (System overview)")
-        print("  🏛️  architecture-clean.png          (Clean Architecture layers)")
-        print("  📡 architecture-sse-flow.png       (SSE event streaming)")
-        print("  💾 architecture-dual-database.png  (SQL Server + PostgreSQL)")
-        print("  📈 architecture-observability.png  (OpenTelemetry + Aspire)")
-        print("  🛡️  architecture-content-safety.png (Azure OpenAI filtering)")
-        print("  🔄 architecture-streaming.png      (Streaming architecture)")
-        print("  📋 architecture-event-types.png    (SSE event types)")
-        print("\nC4 Model Diagrams:")
-        print("  🌐 c4-1-context.png                (Level 1: System Context)")
-        print("  📦 c4-2-container.png              (Level 2: Containers)")
-        print("  🔧 c4-3-component-backend.png      (Level 3: Backend Components)")
-        
+        _FORCE = args.force
+        _RICH_CONTEXT = args.rich
+
+        # Building the DOT sources is cheap pure-Python work; the specs
+        # just queue their stale diagrams, which are then rendered by one
+        # batched Graphviz invocation in render_pending(). Diagrams whose
+        # outputs are already newer than this script are skipped outright.
+        up_to_date = set()
+        for spec in specs:
+            if not _FORCE and _up_to_date(spec.name):
+                up_to_date.add(spec.name)
+                continue
+            render_spec(spec)
+        rendered = {os.path.basename(path) for path in render_pending()}
+        rendered |= {os.path.basename(path) for path in _TEMPLATED}
+        for spec in specs:
+            name = spec.name
+            # The templated diagram only produces an .svg; everything
+            # else emits one file per requested format.
+            if spec.template is not None and not _RICH_CONTEXT:
+                files = [f"{name}.svg"]
+            else:
+                files = [f"{name}.{fmt}" for fmt in FORMATS]
+            if name in up_to_date:
+                suffix = " (up to date)"
+            elif name not in rendered:
+                suffix = " (cached)"
+            else:
+                suffix = ""
+            lines.append(f"   ✅ {', '.join(files)}{suffix}")
+
+        lines += [
+            f"\n{'=' * 60}",
+            f"✅ All diagrams generated in: {OUTPUT_DIR}",
+            "=" * 60,
+            "\nArchitecture Diagrams:",
+            "  📊 architecture-main           (System overview)",
+            "  🏛️  architecture-clean          (Clean Architecture layers)",
+            "  📡 architecture-sse-flow       (SSE event streaming)",
+            "  💾 architecture-dual-database  (SQL Server + PostgreSQL)",
+            "  📈 architecture-observability  (OpenTelemetry + Aspire)",
+            "  🛡️  architecture-content-safety (Azure OpenAI filtering)",
+            "  🔄 architecture-streaming      (Streaming architecture)",
+            "  📋 architecture-event-types    (SSE event types)",
+            "\nC4 Model Diagrams:",
+            "  🌐 c4-1-context                (Level 1: System Context)",
+            "  📦 c4-2-container              (Level 2: Containers)",
+            "  🔧 c4-3-component-backend      (Level 3: Backend Components)",
+        ]
     except Exception as e:
-        print(f"\n❌ Error: {e}")
+        lines.append(f"\n❌ Error: {e}")
         import traceback
-        traceback.print_exc()
-        print("\n" + "=" * 60)
-        print("Make sure you have installed:")
-        print("  pip install diagrams")
-        print("  And Graphviz: https://graphviz.org/download/")
-        print("=" * 60)
+        lines += [
+            traceback.format_exc(),
+            "\n" + "=" * 60,
+            "Make sure you have installed:",
+            "  pip install diagrams",
+            "  And Graphviz: https://graphviz.org/download/",
+            "=" * 60,
+        ]
+
+    sys.stdout.write("\n".join(lines) + "\n")